@@ -0,0 +1,153 @@
+import logging
+import os
+import sqlite3
+from unittest.mock import MagicMock
+
+import pytest
+
+from music_collection.models import song_model
+from music_collection.models.playlist_model import PlaylistModel
+from music_collection.models.song_model import Song
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _quiet_logs():
+    """Silence the music_collection loggers for the test session.
+
+    Each module logger sets its own level and stderr handler, so the levels are
+    raised per logger and restored afterwards. Tests that check log output opt
+    back in with caplog.set_level().
+    """
+    loggers = [
+        logging.getLogger(name)
+        for name in list(logging.root.manager.loggerDict)
+        if name.startswith("music_collection")
+    ]
+    levels = [logger.level for logger in loggers]
+    for logger in loggers:
+        logger.setLevel(logging.CRITICAL)
+    yield
+    for logger, level in zip(loggers, levels):
+        logger.setLevel(level)
+
+class _ConnectionContext:
+    """Stand-in for the get_db_connection() context manager that yields a fixed connection."""
+
+    __slots__ = ("conn",)
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        return self.conn
+
+    def __exit__(self, *exc_info):
+        return False
+
+# Mocking the database connection for tests. The mocks are built once per module
+# and reset and patched in for each test that requests mock_cursor.
+
+# Context manager for the module's mock connection, set once by _mock_cursor_module
+_MOCK_CONN_REF = {}
+
+def _get_mock_db_connection():
+    """get_db_connection() replacement that hands out the mock connection."""
+    return _MOCK_CONN_REF["context"]
+
+@pytest.fixture(scope="module")
+def _mock_cursor_module():
+    mock_conn = MagicMock(spec=sqlite3.Connection)
+    mock_cursor = MagicMock(spec=sqlite3.Cursor)
+
+    # Mock the connection's cursor; like sqlite3.Cursor, the cursor refers back to its connection
+    mock_conn.cursor.return_value = mock_cursor
+    mock_cursor.connection = mock_conn
+
+    # Mock the get_db_connection context manager from sql_utils with one reusable instance
+    _MOCK_CONN_REF["context"] = _ConnectionContext(mock_conn)
+
+    yield mock_cursor
+
+    _MOCK_CONN_REF.clear()
+
+@pytest.fixture
+def mock_cursor(_mock_cursor_module, monkeypatch):
+    """Patch in the shared mock connection, reset so no expectations or recorded calls leak between tests."""
+    mock_cursor = _mock_cursor_module
+    mock_cursor.connection.reset_mock()
+    mock_cursor.reset_mock(return_value=True, side_effect=True)
+    mock_cursor.fetchone.return_value = None  # Default return for queries
+    mock_cursor.fetchall.return_value = []
+
+    monkeypatch.setattr(song_model, "get_db_connection", _get_mock_db_connection)
+    return mock_cursor  # Return the mock cursor so we can set expectations per test
+
+# A real in-memory database for the behavioral tests. The schema is created once
+# per session and every test runs inside a SAVEPOINT that is rolled back afterwards.
+# Each pytest-xdist worker is a separate process and so gets its own database.
+_CREATE_TABLE_SQL_PATH = os.path.join(os.path.dirname(__file__), "..", "sql", "create_song_table.sql")
+
+class _TestConnection(sqlite3.Connection):
+    """Connection whose commit() is a no-op, so the test's SAVEPOINT owns every write."""
+
+    def commit(self):
+        pass
+
+# Context manager for the session's connection, set once by the conn fixture
+_CONN_REF = {}
+
+def _get_test_db_connection():
+    """get_db_connection() replacement that hands out the in-memory connection."""
+    return _CONN_REF["context"]
+
+@pytest.fixture(scope="session")
+def conn():
+    conn = sqlite3.connect(":memory:", check_same_thread=False, factory=_TestConnection)
+    with open(_CREATE_TABLE_SQL_PATH, "r") as fh:
+        conn.executescript(fh.read())
+    _CONN_REF["context"] = _ConnectionContext(conn)
+
+    yield conn
+
+    _CONN_REF.clear()
+    conn.close()
+
+@pytest.fixture
+def db(conn, monkeypatch):
+    """Point get_db_connection at the in-memory database and roll back the test's writes."""
+    monkeypatch.setattr(song_model, "get_db_connection", _get_test_db_connection)
+
+    conn.execute("SAVEPOINT test")
+    yield conn
+    conn.execute("ROLLBACK TO test")
+    conn.execute("RELEASE test")
+
+@pytest.fixture(scope="module")
+def _playlist_model_module():
+    """A single instance of PlaylistModel shared by a module's tests."""
+    return PlaylistModel()
+
+@pytest.fixture
+def playlist_model(_playlist_model_module):
+    """Fixture to provide the shared PlaylistModel, emptied and rewound for each test."""
+    _playlist_model_module.playlist.clear()
+    _playlist_model_module.current_track_number = 1
+    return _playlist_model_module
+
+# Fixtures providing sample songs for the tests.
+# The songs are only read, never modified, so they are built once at import.
+_SONG_1 = Song(1, 'Artist 1', 'Song 1', 2022, 'Pop', 180)
+_SONG_2 = Song(2, 'Artist 2', 'Song 2', 2021, 'Rock', 155)
+
+@pytest.fixture(scope="session")
+def sample_song1():
+    return _SONG_1
+
+@pytest.fixture(scope="session")
+def sample_song2():
+    return _SONG_2
+
+@pytest.fixture(scope="session")
+def sample_playlist(sample_song1, sample_song2):
+    # A tuple, so a test can't reorder the shared sample in place
+    return (sample_song1, sample_song2)
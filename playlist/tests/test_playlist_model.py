@@ -1,32 +1,13 @@
-import pytest
-
-from music_collection.models.playlist_model import PlaylistModel
-from music_collection.models.song_model import Song
+import logging
 
+import pytest
 
-@pytest.fixture()
-def playlist_model():
-    """Fixture to provide a new instance of PlaylistModel for each test."""
-    return PlaylistModel()
 
 @pytest.fixture
 def mock_update_play_count(mocker):
     """Mock the update_play_count function for testing purposes."""
     return mocker.patch("music_collection.models.playlist_model.update_play_count")
 
-"""Fixtures providing sample songs for the tests."""
-@pytest.fixture
-def sample_song1():
-    return Song(1, 'Artist 1', 'Song 1', 2022, 'Pop', 180)
-
-@pytest.fixture
-def sample_song2():
-    return Song(2, 'Artist 2', 'Song 2', 2021, 'Rock', 155)
-
-@pytest.fixture
-def sample_playlist(sample_song1, sample_song2):
-    return [sample_song1, sample_song2]
-
 
 ##################################################
 # Add Song Management Test Cases
@@ -76,6 +57,7 @@ def test_clear_playlist(playlist_model, sample_song1):
 
 def test_clear_playlist_empty_playlist(playlist_model, caplog):
     """Test clearing the entire playlist when it's empty."""
+    caplog.set_level(logging.WARNING, logger="music_collection.models.playlist_model")
     playlist_model.clear_playlist()
     assert len(playlist_model.playlist) == 0, "Playlist should be empty after clearing"
     assert "Clearing an empty playlist" in caplog.text, "Expected warning message when clearing an empty playlist"